@@ -11,6 +11,8 @@ Features:
 - Display strongest associations
 """
 
+import os
+
 import streamlit as st
 
 from graph_plotting import (
@@ -48,6 +50,57 @@ st.write(
 # -----------------------------
 # Load Dataset & Build Graph
 # -----------------------------
+
+@st.cache_resource(show_spinner="Building graph…")
+def load_graph(filename, mtime):
+    """
+    Build the graph once per process and keep it cached.
+
+    `mtime` is part of the cache key so that editing the CSV
+    automatically invalidates the cached graph.
+    """
+    graph_obj = build_graph_from_file(filename)
+    return graph_obj, graph_obj.as_adjacency_dict()
+
+
+@st.cache_data(show_spinner=False)
+def cached_frequent_pairs(graph_id, min_support, _graph):
+    """Memoized frequent_pairs — only recomputed when the slider value changes."""
+    return frequent_pairs(_graph, min_support=min_support)
+
+
+@st.cache_data(show_spinner=False)
+def cached_top_bundles(graph_id, k, _graph):
+    """Memoized top_product_bundles, keyed on (graph_id, k)."""
+    return top_product_bundles(_graph, k=k)
+
+
+@st.cache_data(show_spinner=False)
+def cached_item_list(graph_id, _graph_obj):
+    """Sorted item list for the selectboxes, cached per loaded graph."""
+    return _graph_obj.sorted_items()
+
+
+@st.cache_resource(show_spinner=False)
+def cached_association_fig(graph_id, top_k, _graph):
+    """Memoized strongest-associations figure for Tab 6."""
+    return draw_top_k_association_graph(_graph, top_k=top_k)
+
+
+def preview_join(entries, sep, limit=50):
+    """
+    Join at most `limit` entries into one string, noting how many were
+    omitted — keeps the payload shipped to the browser bounded even
+    for very long result lists.
+    """
+    if not entries:
+        return "None"
+    text = sep.join(entries[:limit])
+    if len(entries) > limit:
+        text += f" …(+{len(entries) - limit} more)"
+    return text
+
+
 st.sidebar.header("📂 Data Loading")
 
 filename = st.sidebar.text_input(
@@ -56,24 +109,26 @@ filename = st.sidebar.text_input(
     help="Your file must be in the working directory.",
 )
 
-if st.sidebar.button("Build Graph"):
-    try:
-        graph_obj = build_graph_from_file(filename)
-        graph = graph_obj.as_adjacency_dict()
-        st.success(f"Graph built successfully: {graph_obj.num_items()} items, {graph_obj.num_edges()} edges.")
-        st.session_state["graph"] = graph
-        st.session_state["graph_obj"] = graph_obj
-    except Exception as e:
-        st.error(f"Error: {e}")
-
-# Stop if graph hasn't been built yet
-if "graph" not in st.session_state:
+if not os.path.exists(filename):
     st.info("Load the dataset to begin exploring the graph algorithms.")
     st.stop()
 
-graph = st.session_state["graph"]
-graph_obj = st.session_state["graph_obj"]
-items = sorted(graph.keys())
+mtime = os.path.getmtime(filename)
+
+try:
+    graph_obj, graph = load_graph(filename, mtime)
+except Exception as e:
+    st.error(f"Error: {e}")
+    st.stop()
+
+# Stable identity of the loaded graph, used as a cache key below.
+graph_id = (filename, mtime)
+
+st.sidebar.success(
+    f"Graph ready: {graph_obj.num_items()} items, {graph_obj.num_edges()} edges."
+)
+
+items = cached_item_list(graph_id, graph_obj)
 
 
 # ============================================================
@@ -125,16 +180,17 @@ with tab1:
     # --------------------------------------------------
     st.subheader("🔗 Shared Associated Items")
 
-    neighbours_a = set(graph_obj.neighbours(item_a).keys())
-    neighbours_b = set(graph_obj.neighbours(item_b).keys())
+    nb_a = graph_obj.neighbours(item_a)
+    nb_b = graph_obj.neighbours(item_b)
 
-    shared = neighbours_a.intersection(neighbours_b)
+    # Dict key views intersect set-style without building temporary sets
+    shared = list(nb_a.keys() & nb_b.keys())
 
     if shared:
         st.table({
-            "Shared Item": list(shared),
-            "With A": [graph_obj.edge_weight(item_a, x) for x in shared],
-            "With B": [graph_obj.edge_weight(item_b, x) for x in shared],
+            "Shared Item": shared,
+            "With A": [nb_a[x] for x in shared],
+            "With B": [nb_b[x] for x in shared],
         })
     else:
         st.info("No shared associated items found.")
@@ -195,7 +251,7 @@ with tab3:
         1, 20, 2
     )
 
-    fpairs = frequent_pairs(graph, min_support=min_support)
+    fpairs = cached_frequent_pairs(graph_id, min_support, graph)
 
     if fpairs:
         st.table({
@@ -215,7 +271,7 @@ with tab4:
 
     k = st.slider("Show top K bundles:", 1, 20, 5)
 
-    bundles = top_product_bundles(graph, k=k)
+    bundles = cached_top_bundles(graph_id, k, graph)
 
     st.table({
         "Item A": [pair[0][0] for pair in bundles],
@@ -235,23 +291,25 @@ with tab5:
     st.subheader("🔍 Direct Co-Purchases")
     direct = graph_obj.neighbours(start_item)
     if direct:
+        # Single pass over the dict instead of one per column
+        names, counts = zip(*direct.items())
         st.table({
-            "Item": list(direct.keys()),
-            "Co-purchase Count": list(direct.values())
+            "Item": list(names),
+            "Co-purchase Count": list(counts)
         })
     else:
         st.info("No direct associations found.")
 
     # BFS & DFS results
-    bfs_all = bfs_related_items(graph, start_item)[:15]
-    dfs_all = dfs_related_items(graph, start_item)[:15]
+    bfs_all = bfs_related_items(graph_obj, start_item, max_items=15)
+    dfs_all = dfs_related_items(graph_obj, start_item, max_items=15)
 
     # Optional: text display below
     st.subheader("📜 BFS Text Output")
-    st.write(", ".join(bfs_all) if bfs_all else "None")
+    st.write(preview_join(bfs_all, ", "))
 
     st.subheader("📜 DFS Text Output")
-    st.write(" → ".join(dfs_all) if dfs_all else "None")
+    st.write(preview_join(dfs_all, " → "))
     
     
 with tab6:
@@ -259,7 +317,7 @@ with tab6:
 
     k = st.slider("Number of strongest associations to display:", 5, 20, 10)
 
-    fig = draw_top_k_association_graph(graph, top_k=k)
+    fig = cached_association_fig(graph_id, k, graph_obj)
     if fig:
         st.pyplot(fig, width='content')
     else:
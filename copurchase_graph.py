@@ -14,14 +14,133 @@ This structure will later allow:
 - and mining of frequent item pairs.
 """
 
-from typing import Dict, List, Tuple, Optional
+import heapq
+from collections import defaultdict
+from typing import Dict, Iterator, List, Tuple, Optional
+
+import numpy as np
+
+# Parallel-array ("structure of arrays") edge representation:
+# (items, src, dst, weights) where src/dst index into items.
+EdgeArrays = Tuple[List[str], "np.ndarray", "np.ndarray", "np.ndarray"]
+
+# CSR (compressed sparse row) representation:
+# (items, item_to_id, indptr, indices, weights) — the neighbours of
+# item id u are indices[indptr[u]:indptr[u + 1]], with co-purchase
+# counts in the matching slice of weights.
+CSRArrays = Tuple[List[str], Dict[str, int], "np.ndarray", "np.ndarray", "np.ndarray"]
+
+
+def _weight_dtype(max_weight: int):
+    """
+    Pick the narrowest unsigned dtype that holds the largest
+    co-purchase count. Edge scans are memory-bandwidth-bound, so
+    halving the bytes per weight roughly halves their cost.
+    """
+    return np.uint16 if max_weight < 2 ** 16 else np.uint32
+
+
+def build_edge_arrays(adjacency: Dict[str, Dict[str, int]]) -> EdgeArrays:
+    """
+    Flatten an adjacency dict into parallel NumPy arrays.
+
+    Each undirected edge appears exactly once (deduplicated on the
+    canonical item1 < item2 ordering). The arrays allow algorithms to
+    filter/rank edges with vectorized NumPy operations instead of
+    Python-level loops over nested dicts.
+    """
+    # Ids follow lexicographic item order, so comparing ids below is
+    # equivalent to comparing the item strings — one integer compare
+    # per edge instead of a PyUnicode comparison.
+    items = sorted(adjacency)
+    item_to_id = {item: idx for idx, item in enumerate(items)}
+
+    src: List[int] = []
+    dst: List[int] = []
+    weights: List[int] = []
+
+    # Bind the append methods once — the loop body runs per edge
+    src_append = src.append
+    dst_append = dst.append
+    weight_append = weights.append
+
+    for item, neighbours in adjacency.items():
+        u = item_to_id[item]
+        for neighbour, weight in neighbours.items():
+            v = item_to_id[neighbour]
+            if u < v:  # count each undirected edge once
+                src_append(u)
+                dst_append(v)
+                weight_append(weight)
+
+    return (
+        items,
+        np.array(src, dtype=np.int32),
+        np.array(dst, dtype=np.int32),
+        np.array(weights, dtype=_weight_dtype(max(weights, default=0))),
+    )
+
+
+def build_csr(adjacency: Dict[str, Dict[str, int]]) -> CSRArrays:
+    """
+    Build a CSR view of an adjacency dict.
+
+    Items are interned to integer ids so that traversals walk
+    contiguous int32 arrays instead of hashing item strings and
+    chasing per-item dict objects.
+    """
+    items = list(adjacency)
+    item_to_id = {item: idx for idx, item in enumerate(items)}
+
+    degrees = [len(neighbours) for neighbours in adjacency.values()]
+    indptr = np.asarray(np.cumsum([0] + degrees), dtype=np.int32)
+
+    max_weight = max(
+        (max(neighbours.values()) for neighbours in adjacency.values() if neighbours),
+        default=0,
+    )
+
+    total = int(indptr[-1])
+    indices = np.empty(total, dtype=np.int32)
+    weights = np.empty(total, dtype=_weight_dtype(max_weight))
+
+    # items preserves the dict's key order, so iterating values() here
+    # lines the rows up with the ids — no per-item re-lookup needed
+    pos = 0
+    for neighbours in adjacency.values():
+        for neighbour, weight in neighbours.items():
+            indices[pos] = item_to_id[neighbour]
+            weights[pos] = weight
+            pos += 1
+
+    return items, item_to_id, indptr, indices, weights
 
 
 class CoPurchaseGraph:
     def __init__(self) -> None:
         # Adjacency list representation:
         # { item: { other_item: weight, ... }, ... }
-        self._adjacency: Dict[str, Dict[str, int]] = {}
+        # Nested defaultdicts let the build loop do adj[a][b] += 1
+        # without per-call .get() lookups.
+        self._adjacency: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+        # Lazily built edge arrays (see build_edge_arrays) and CSR view
+        # (see build_csr), invalidated whenever the graph is mutated.
+        self._edge_arrays: Optional[EdgeArrays] = None
+        self._csr: Optional[CSRArrays] = None
+
+        # Edges sorted by descending weight, for O(top_n) ranking
+        # queries; invalidated with the other caches on mutation.
+        self._ranked_edges: Optional[List[Tuple[str, str, int]]] = None
+
+        # Cached sorted item list; invalidated when a new item appears.
+        self._sorted_items: Optional[List[str]] = None
+
+        # Number of undirected edges, maintained incrementally so that
+        # num_edges() is O(1) instead of a full adjacency scan.
+        self._edge_count: int = 0
 
     # -------------------------------------------------
     # Basic node & edge operations
@@ -32,7 +151,11 @@ class CoPurchaseGraph:
         Does nothing if the item is already present.
         """
         if item not in self._adjacency:
-            self._adjacency[item] = {}
+            self._adjacency[item]  # created by the defaultdict factory
+            self._edge_arrays = None
+            self._csr = None
+            self._ranked_edges = None
+            self._sorted_items = None
 
     def add_co_purchase(self, item1: str, item2: str) -> None:
         """
@@ -44,15 +167,47 @@ class CoPurchaseGraph:
         if item1 == item2:
             return
 
-        # Make sure both items exist as nodes
-        if item1 not in self._adjacency:
-            self._adjacency[item1] = {}
-        if item2 not in self._adjacency:
-            self._adjacency[item2] = {}
+        adj = self._adjacency
+
+        # Membership tests on a defaultdict do not create entries, so
+        # these checks are safe ways to spot new nodes/edges.
+        if item1 not in adj or item2 not in adj:
+            self._sorted_items = None
+        if item2 not in adj[item1]:
+            self._edge_count += 1
+
+        # Increase weight in both directions (undirected graph); the
+        # defaultdict factories create missing nodes and zero weights.
+        adj[item1][item2] += 1
+        adj[item2][item1] += 1
+        self._edge_arrays = None
+        self._csr = None
+        self._ranked_edges = None
+
+    def bulk_add_co_purchases(self, pair_counts: Dict[Tuple[str, str], int]) -> None:
+        """
+        Merge pre-aggregated co-purchase counts into the graph.
+
+        `pair_counts` maps canonical (item1, item2) pairs (e.g. from a
+        collections.Counter over basket combinations) to the number of
+        times they were co-purchased. One dict update per distinct pair
+        replaces one add_co_purchase call per observation.
+        """
+        adj = self._adjacency
 
-        # Increase weight in both directions (undirected graph)
-        self._adjacency[item1][item2] = self._adjacency[item1].get(item2, 0) + 1
-        self._adjacency[item2][item1] = self._adjacency[item2].get(item1, 0) + 1
+        for (item1, item2), count in pair_counts.items():
+            if item1 == item2:
+                continue
+            if item1 not in adj or item2 not in adj:
+                self._sorted_items = None
+            if item2 not in adj[item1]:
+                self._edge_count += 1
+            adj[item1][item2] += count
+            adj[item2][item1] += count
+
+        self._edge_arrays = None
+        self._csr = None
+        self._ranked_edges = None
 
     # -------------------------------------------------
     # Query methods
@@ -60,8 +215,29 @@ class CoPurchaseGraph:
     def items(self) -> List[str]:
         """
         Return a sorted list of all items (nodes) in the graph.
+        Served from the cache maintained by sorted_items().
+        """
+        return self.sorted_items()
+
+    def iter_items(self) -> Iterator[str]:
+        """
+        Iterate over all items in insertion order, without sorting.
+        Prefer this over items() when the caller does not need sort
+        order.
+        """
+        return iter(self._adjacency)
+
+    def sorted_items(self) -> List[str]:
         """
-        return sorted(self._adjacency.keys())
+        Return the sorted item list, computed once and cached.
+
+        Items only change while the graph is being built, so callers on
+        the hot UI path (e.g. selectboxes) can reuse the same list
+        instead of re-sorting every node on each access.
+        """
+        if self._sorted_items is None:
+            self._sorted_items = sorted(self._adjacency)
+        return self._sorted_items
 
     def neighbours(self, item: str) -> Dict[str, int]:
         """
@@ -105,13 +281,10 @@ class CoPurchaseGraph:
     def num_edges(self) -> int:
         """
         Return the number of undirected edges in the graph.
-        Each pair is stored twice in the adjacency list (A->B, B->A),
-        so we divide by 2.
+        The count is maintained incrementally in add_co_purchase,
+        so this is O(1).
         """
-        total = 0
-        for item in self._adjacency:
-            total += len(self._adjacency[item])
-        return total // 2
+        return self._edge_count
 
     def top_neighbours(self, item: str, k: int = 5) -> List[Tuple[str, int]]:
         """
@@ -121,17 +294,50 @@ class CoPurchaseGraph:
         This will be used later for recommendation-style queries.
         """
         neighbours = self.neighbours(item)
-        # Sort by weight descending
-        sorted_neighbours = sorted(
-            neighbours.items(),
-            key=lambda pair: pair[1],
-            reverse=True,
-        )
-        return sorted_neighbours[:k]
+        # O(d log k) top-k selection instead of sorting all d neighbours
+        return heapq.nlargest(k, neighbours.items(), key=lambda pair: pair[1])
 
     # -------------------------------------------------
     # Utility / debug
     # -------------------------------------------------
+    def as_edge_arrays(self) -> EdgeArrays:
+        """
+        Return the graph's edges as (items, src, dst, weights) parallel
+        NumPy arrays. Built once on first use and cached; any mutation
+        of the graph invalidates the cache.
+        """
+        if self._edge_arrays is None:
+            self._edge_arrays = build_edge_arrays(self._adjacency)
+        return self._edge_arrays
+
+    def as_csr_arrays(self) -> CSRArrays:
+        """
+        Return the CSR view (items, item_to_id, indptr, indices,
+        weights) of the graph. Built once on first use and cached; any
+        mutation of the graph invalidates it.
+        """
+        if self._csr is None:
+            self._csr = build_csr(self._adjacency)
+        return self._csr
+
+    def ranked_edges(self) -> List[Tuple[str, str, int]]:
+        """
+        Return every undirected edge as (item1, item2, weight), sorted
+        by descending weight. The list is built once after loading and
+        cached, so "strongest associations" style queries become a
+        plain list slice.
+        """
+        if self._ranked_edges is None:
+            items, src, dst, weights = self.as_edge_arrays()
+            # argsort ascending then reverse — negating would wrap the
+            # unsigned weight array
+            order = np.argsort(weights)[::-1]
+            self._ranked_edges = [
+                (items[src[i]], items[dst[i]], int(weights[i]))
+                for i in order.tolist()
+            ]
+        return self._ranked_edges
+
     def as_adjacency_dict(self) -> Dict[str, Dict[str, int]]:
         """
         Expose the raw adjacency dictionary.
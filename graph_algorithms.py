@@ -8,17 +8,57 @@ Algorithms implemented from module content:
 - Sorting algorithm → rank bundles by frequency
 """
 
+import bisect
+import heapq
 from collections import deque
+from operator import itemgetter
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+from copurchase_graph import CoPurchaseGraph, EdgeArrays, build_edge_arrays
+
+try:
+    # Optional: JIT-compiled CSR traversals (requires numba)
+    import graph_algorithms_numba as _jit
+except ImportError:
+    _jit = None
+
 GraphAdj = Dict[str, Dict[str, int]]
 
 
+def _edge_arrays(graph) -> EdgeArrays:
+    """
+    Resolve a graph argument to (items, src, dst, weights) edge arrays.
+
+    A CoPurchaseGraph returns its cached arrays; a plain adjacency dict
+    is flattened on the fly.
+    """
+    if isinstance(graph, CoPurchaseGraph):
+        return graph.as_edge_arrays()
+    return build_edge_arrays(graph)
+
+
+def _topk_edge_order(weights, k):
+    """
+    Indices of the k heaviest edges in descending weight order.
+
+    Uses the compiled heap kernel when numba is installed; otherwise
+    falls back to argpartition (weights are unsigned, so the fallback
+    sorts ascending and reverses rather than negating).
+    """
+    k = min(k, weights.size)
+    if _jit is not None:
+        return _jit.topk_edge_indices(weights, k)
+    idx = np.argpartition(weights, weights.size - k)[-k:]
+    return idx[np.argsort(weights[idx])[::-1]]
+
+
 # ============================================================
 # 1. GRAPH TRAVERSAL ALGORITHMS FOR RELATED ITEM DISCOVERY
 # ============================================================
 
-def bfs_related_items(graph: GraphAdj, start_item: str) -> List[str]:
+def bfs_related_items(graph: GraphAdj, start_item: str, max_items: int = None) -> List[str]:
     """
     Uses BFS to identify all items related to `start_item` by co-purchases.
 
@@ -27,11 +67,32 @@ def bfs_related_items(graph: GraphAdj, start_item: str) -> List[str]:
     - Items indirectly related (via paths) appear later
 
     This satisfies: "Use BFS to identify related items"
+
+    When given a CoPurchaseGraph, the traversal runs on its CSR view:
+    neighbour enumeration becomes a contiguous int32 slice instead of
+    a string-keyed dict walk.
+
+    `max_items` bounds the result: the traversal stops as soon as that
+    many related items have been found, so callers that only display a
+    prefix pay O(max_items * avg_degree) instead of O(V + E).
     """
+    if isinstance(graph, CoPurchaseGraph):
+        items, item_to_id, indptr, indices, _ = graph.as_csr_arrays()
+        if start_item not in item_to_id:
+            return []
+        if _jit is not None:
+            limit = -1 if max_items is None else max_items
+            order = _jit.bfs_order_csr(indptr, indices, item_to_id[start_item], limit).tolist()
+        else:
+            order = _bfs_order_csr(indptr, indices, item_to_id[start_item], max_items)
+        return [items[i] for i in order]
+
     if start_item not in graph:
         return []
 
-    visited = set()
+    # Mark on enqueue: every node (including the start) enters the
+    # queue exactly once, so queue traffic is O(V) rather than O(E).
+    visited = {start_item}
     queue = deque([start_item])
     related = []  # all reachable items except start_item
 
@@ -42,12 +103,42 @@ def bfs_related_items(graph: GraphAdj, start_item: str) -> List[str]:
             if neighbour not in visited:
                 visited.add(neighbour)
                 related.append(neighbour)
+                if max_items is not None and len(related) >= max_items:
+                    return related
                 queue.append(neighbour)
 
     return related
 
 
-def dfs_related_items(graph: GraphAdj, start_item: str) -> List[str]:
+def _bfs_order_csr(indptr, indices, start: int, max_items: int = None) -> List[int]:
+    """
+    BFS over a CSR graph; returns the visit order of the item ids
+    reachable from `start` (excluding `start` itself), stopping early
+    once `max_items` ids have been collected.
+
+    `visited` is a boolean bitmask indexed by item id — membership is a
+    single array load/store instead of hashing into a Python set.
+    """
+    visited = np.zeros(indptr.size - 1, dtype=np.bool_)
+    visited[start] = True
+    queue = deque([start])
+    related: List[int] = []
+
+    while queue:
+        u = queue.popleft()
+
+        for v in indices[indptr[u]:indptr[u + 1]].tolist():
+            if not visited[v]:
+                visited[v] = True
+                related.append(v)
+                if max_items is not None and len(related) >= max_items:
+                    return related
+                queue.append(v)
+
+    return related
+
+
+def dfs_related_items(graph: GraphAdj, start_item: str, max_items: int = None) -> List[str]:
     """
     Uses DFS to identify deep associations from start_item.
 
@@ -56,19 +147,43 @@ def dfs_related_items(graph: GraphAdj, start_item: str) -> List[str]:
     - Associations not found by looking only at direct neighbours
 
     This satisfies: "Use DFS to identify related items"
+
+    The traversal is iterative (explicit node stack) rather than
+    recursive, so deep co-purchase chains neither hit Python's
+    recursion limit nor pay a call-frame per visited node. Pushing
+    whole neighbour sets with stack.extend keeps the inner iteration
+    in C; nodes are therefore expanded in reverse neighbour order,
+    which is still a valid depth-first order.
+
+    `max_items` bounds the result in the same way as for
+    bfs_related_items.
     """
-    visited = set()
-    related = []
+    if isinstance(graph, CoPurchaseGraph):
+        if _jit is not None:
+            items, item_to_id, indptr, indices, _ = graph.as_csr_arrays()
+            if start_item not in item_to_id:
+                return []
+            limit = -1 if max_items is None else max_items
+            order = _jit.dfs_order_csr(indptr, indices, item_to_id[start_item], limit)
+            return [items[i] for i in order.tolist()]
+        graph = graph.as_adjacency_dict()
 
-    def _dfs(node: str):
-        for neighbour in graph[node]:
-            if neighbour not in visited:
-                visited.add(neighbour)
-                related.append(neighbour)
-                _dfs(neighbour)
+    if start_item not in graph:
+        return []
 
-    if start_item in graph:
-        _dfs(start_item)
+    visited = {start_item}
+    related = []
+    stack = list(graph[start_item])
+
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        related.append(node)
+        if max_items is not None and len(related) >= max_items:
+            return related
+        stack.extend(graph[node])
 
     return related
 
@@ -88,59 +203,61 @@ def frequent_pairs(graph: GraphAdj, min_support: int = 2) -> List[Tuple[Tuple[st
         - We filter pairs whose weight >= min_support
 
     This is equivalent to a simplified Apriori algorithm (size-2 itemsets).
+
+    The edge list is held as parallel NumPy arrays, so the support
+    filter runs as a single vectorized comparison instead of a Python
+    loop over every edge. A CoPurchaseGraph does even less work: its
+    cached descending-weight edge list makes "weight >= min_support" a
+    monotone prefix, found by bisection in O(log E).
     """
 
-    results = []
+    if isinstance(graph, CoPurchaseGraph):
+        ranked = graph.ranked_edges()
+        cut = bisect.bisect_right(ranked, -min_support, key=lambda edge: -edge[2])
+        return [((a, b), w) for a, b, w in ranked[:cut]]
+
+    items, src, dst, weights = _edge_arrays(graph)
 
-    for item in graph:
-        for neighbour, weight in graph[item].items():
-            if item < neighbour:  # avoid duplicates
-                if weight >= min_support:
-                    results.append(((item, neighbour), weight))
+    mask = weights >= min_support
 
-    return results
+    return [
+        ((items[u], items[v]), w)
+        for u, v, w in zip(
+            src[mask].tolist(), dst[mask].tolist(), weights[mask].tolist()
+        )
+    ]
 
 
 # ============================================================
 # 3. SORTING / RANKING ALGORITHM FOR TOP BUNDLES
 # ============================================================
 
-def quick_sort_items(pairs: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
-    if len(pairs) <= 1:
-        return pairs
-
-    pivot = pairs[len(pairs) // 2][1]
-
-    left = [p for p in pairs if p[1] > pivot]
-    middle = [p for p in pairs if p[1] == pivot]
-    right = [p for p in pairs if p[1] < pivot]
-
-    return quick_sort_items(left) + middle + quick_sort_items(right)
-
-
-
 def top_product_bundles(graph: GraphAdj, k: int = 5) -> List[Tuple[Tuple[str, str], int]]:
     """
     Identifies the top-K strongest product bundles.
 
-    ALGORITHM (Quick Sort Based Ranking):
-    -------------------------------------
-    Step 1: Extract all item pairs and their co-purchase frequency
-    Step 2: Sort pairs using Quick Sort (descending by frequency)
-    Step 3: Return the top K results
-    """
+    ALGORITHM (Partition-Based Ranking):
+    ------------------------------------
+    Step 1: Take the edge arrays (items, src, dst, weights)
+    Step 2: Select the K heaviest edges with np.argpartition — O(E)
+            instead of a full O(E log E) sort
+    Step 3: Sort only those K winners by descending frequency
 
-    all_pairs = []
+    A CoPurchaseGraph skips all of that and slices its cached
+    descending-weight edge list — O(k) per query.
+    """
+    if isinstance(graph, CoPurchaseGraph):
+        return [((a, b), w) for a, b, w in graph.ranked_edges()[:k]]
 
-    for item in graph:
-        for neighbour, weight in graph[item].items():
-            if item < neighbour:  # avoid duplicate pairs
-                all_pairs.append(((item, neighbour), weight))
+    items, src, dst, weights = _edge_arrays(graph)
 
-    # Apply Quick Sort instead of Python's built-in sort
-    sorted_pairs = quick_sort_items(all_pairs)
+    if weights.size == 0:
+        return []
 
-    return sorted_pairs[:k]
+    return [
+        ((items[src[i]], items[dst[i]]), int(weights[i]))
+        for i in _topk_edge_order(weights, k).tolist()
+    ]
 
 
 
@@ -156,18 +273,17 @@ def recommend_items(graph: GraphAdj, item: str, top_n: int = 5) -> List[Tuple[st
     ALGORITHM:
     ----------
     Step 1: Look up graph[item]
-    Step 2: Sort all neighbours by descending weight
-    Step 3: Return first N
+    Step 2: Keep the N heaviest neighbours in a size-N heap
+    Step 3: Return them in descending order
 
-    Sorting → O(d log d), where d = number of neighbours.
+    heapq.nlargest runs in C and is O(d log N), where d = number of
+    neighbours — cheaper than a full O(d log d) sort for small N.
     """
-    if item not in graph:
+    neighbours = graph.get(item)
+    if not neighbours:
         return []
 
-    neighbour_pairs = list(graph[item].items())
-    sorted_pairs = quick_sort_items(neighbour_pairs)
-    
-    return sorted_pairs[:top_n]
+    return heapq.nlargest(top_n, neighbours.items(), key=itemgetter(1))
 
 
 # ============================================================
@@ -180,14 +296,21 @@ def strongest_associations(graph: GraphAdj, top_n: int = 10) -> List[Tuple[str,
     (itemA, itemB, frequency)
 
     Used for simple graph-based visualisation.
+
+    A CoPurchaseGraph serves this from its cached descending-weight
+    edge list, so the query is an O(top_n) slice instead of a rescan
+    of every edge.
     """
-    edges = []
+    if isinstance(graph, CoPurchaseGraph):
+        return graph.ranked_edges()[:top_n]
+
+    items, src, dst, weights = _edge_arrays(graph)
 
-    for item in graph:
-        for neighbour, weight in graph[item].items():
-            if item < neighbour:
-                edges.append((item, neighbour, weight))
+    if weights.size == 0:
+        return []
 
-    edges.sort(key=lambda x: x[2], reverse=True)
-    return edges[:top_n]
+    return [
+        (items[src[i]], items[dst[i]], int(weights[i]))
+        for i in _topk_edge_order(weights, top_n).tolist()
+    ]
 
@@ -0,0 +1,150 @@
+"""
+Optional Numba-compiled traversal kernels for the CSR graph layout.
+
+These mirror the pure-Python CSR loops in graph_algorithms but run as
+JIT-compiled machine code over the int32 indptr/indices arrays. The
+module imports numba at load time, so graph_algorithms only wires the
+kernels in when the dependency is installed; everything falls back to
+the interpreted loops otherwise.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def bfs_order_csr(indptr, indices, start, limit):
+    """
+    BFS visit order over a CSR graph, excluding the start node.
+
+    The queue is a preallocated int32 array with head/tail cursors —
+    each reachable node enters it exactly once. A non-negative `limit`
+    stops the traversal once that many related nodes are collected.
+    """
+    n = indptr.size - 1
+    visited = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int32)
+
+    visited[start] = True
+    order[0] = start
+    head = 0
+    tail = 1
+
+    while head < tail:
+        u = order[head]
+        head += 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not visited[v]:
+                visited[v] = True
+                order[tail] = v
+                tail += 1
+                if limit >= 0 and tail - 1 >= limit:
+                    return order[1:tail]
+
+    return order[1:tail]
+
+
+@njit(cache=True)
+def _sift_down(heap_w, heap_i, start, size):
+    """Restore the min-heap property from `start` downwards."""
+    root = start
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_w[child + 1] < heap_w[child]:
+            child += 1
+        if heap_w[child] < heap_w[root]:
+            heap_w[root], heap_w[child] = heap_w[child], heap_w[root]
+            heap_i[root], heap_i[child] = heap_i[child], heap_i[root]
+            root = child
+        else:
+            break
+
+
+@njit(cache=True)
+def topk_edge_indices(weights, k):
+    """
+    Indices of the k largest weights, in descending weight order.
+
+    One O(E log k) pass over the weight array with a size-k min-heap
+    held in two preallocated arrays — no Python objects in the loop.
+    """
+    n = weights.size
+    if k > n:
+        k = n
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    heap_w = np.empty(k, dtype=np.int64)
+    heap_i = np.empty(k, dtype=np.int64)
+
+    for i in range(k):
+        heap_w[i] = weights[i]
+        heap_i[i] = i
+    for start in range(k // 2 - 1, -1, -1):
+        _sift_down(heap_w, heap_i, start, k)
+
+    for i in range(k, n):
+        w = weights[i]
+        if w > heap_w[0]:
+            heap_w[0] = w
+            heap_i[0] = i
+            _sift_down(heap_w, heap_i, 0, k)
+
+    # Heap-sort extraction: popping the min repeatedly fills the
+    # output from the back, leaving it in descending weight order
+    out = np.empty(k, dtype=np.int64)
+    size = k
+    while size > 0:
+        out[size - 1] = heap_i[0]
+        size -= 1
+        heap_w[0] = heap_w[size]
+        heap_i[0] = heap_i[size]
+        _sift_down(heap_w, heap_i, 0, size)
+
+    return out
+
+
+@njit(cache=True)
+def dfs_order_csr(indptr, indices, start, limit):
+    """
+    Pre-order DFS visit order over a CSR graph (first-neighbour
+    first), excluding the start node. A non-negative `limit` stops the
+    walk early.
+
+    The explicit stack keeps a (node, next-edge-index) pair per depth
+    level, so it is bounded by the node count.
+    """
+    n = indptr.size - 1
+    visited = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int32)
+    stack_node = np.empty(n, dtype=np.int32)
+    stack_edge = np.empty(n, dtype=np.int64)
+
+    visited[start] = True
+    stack_node[0] = start
+    stack_edge[0] = indptr[start]
+    depth = 0
+    count = 0
+
+    while depth >= 0:
+        u = stack_node[depth]
+        k = stack_edge[depth]
+        if k < indptr[u + 1]:
+            stack_edge[depth] = k + 1
+            v = indices[k]
+            if not visited[v]:
+                visited[v] = True
+                order[count] = v
+                count += 1
+                if limit >= 0 and count >= limit:
+                    return order[:count]
+                depth += 1
+                stack_node[depth] = v
+                stack_edge[depth] = indptr[v]
+        else:
+            depth -= 1
+
+    return order[:count]
@@ -1,7 +1,24 @@
-import matplotlib.pyplot as plt
-import numpy as np
+import functools
+
 from graph_algorithms import strongest_associations
-from matplotlib.patches import FancyArrowPatch
+
+# matplotlib and numpy are imported inside the draw functions so that
+# Streamlit reruns which never plot anything skip the import chain
+# entirely (sys.modules makes repeat imports effectively free).
+
+
+@functools.lru_cache(maxsize=64)
+def _ring(n, radius):
+    """
+    Circular layout: (xs, ys) coordinates for n nodes on a ring of the
+    given radius. The result only depends on (n, radius), so repeated
+    rerenders reuse the same arrays instead of redoing the trig.
+    """
+    import numpy as np
+
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return radius * np.cos(angles), radius * np.sin(angles)
+
 
 def draw_ego_network(center_item, graph, top_n=8):
     """
@@ -10,6 +27,9 @@ def draw_ego_network(center_item, graph, top_n=8):
     - Surrounding nodes = strongest co-purchases
     - Edge thickness = co-purchase frequency
     """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.collections import LineCollection
 
     neighbours = graph.get(center_item, {})
     if not neighbours:
@@ -27,104 +47,48 @@ def draw_ego_network(center_item, graph, top_n=8):
     ax.scatter(0, 0, s=1000, color="#1f77b4", zorder=3)
     ax.text(0, 0, center_item, color="black", ha="center", va="center", fontsize=12)
 
-    angles = np.linspace(0, 2*np.pi, len(sorted_neighbours), endpoint=False)
-    radius = 4
-
-    for i, (item, weight) in enumerate(sorted_neighbours):
-        x = radius * np.cos(angles[i])
-        y = radius * np.sin(angles[i])
-
-        # Edge
-        ax.plot([0, x], [0, y], linewidth=1 + weight * 0.15, color="gray", alpha=0.7)
-
-        # Node
-        ax.scatter(x, y, s=400, color="#aec7e8")
-        ax.text(x * 1.1, y * 1.1, item, ha="center", va="center", fontsize=9)
-
-    ax.axis("off")
-    return fig
-
-
-def draw_top_k_association_graph(graph, top_k=8):
-    """
-    Clean global relationship graph showing top-K strongest associations.
-    Designed for readability and coursework presentation.
-    """
-
-    edges = strongest_associations(graph, top_n=top_k)
-    if not edges:
-        return None
-
-    # Collect unique nodes
-    nodes = list({item for a, b, _ in edges for item in (a, b)})
-
-    # Compact figure (smaller frame)
-    fig, ax = plt.subplots(figsize=(6.5, 5.5))
-    ax.set_title(
-        f"Top {top_k} Strongest Item Associations",
-        fontsize=13,
-        pad=10
-    )
-
-    # Manual layout (balanced, readable)
-    angles = np.linspace(0, 2*np.pi, len(nodes), endpoint=False)
-    radius = 3
-    pos = {
-        node: (radius * np.cos(a), radius * np.sin(a))
-        for node, a in zip(nodes, angles)
-    }
-
-    # Draw edges FIRST (thin, subtle)
-    for a, b, weight in edges:
-        x1, y1 = pos[a]
-        x2, y2 = pos[b]
-
-        ax.plot(
-            [x1, x2],
-            [y1, y2],
-            linewidth=0.8 + weight * 0.08,   # controlled scaling
-            color="gray",
-            alpha=0.6,
-            zorder=1
+    xs, ys = _ring(len(sorted_neighbours), 4)
+    weights = np.array([weight for _, weight in sorted_neighbours])
+
+    # All spokes in one collection, all nodes in one scatter — a single
+    # C-level draw each instead of one Artist per edge/node
+    segments = [((0, 0), (x, y)) for x, y in zip(xs, ys)]
+    ax.add_collection(
+        LineCollection(
+            segments,
+            linewidths=1 + weights * 0.15,
+            colors="gray",
+            alpha=0.7,
+            zorder=1,
         )
+    )
+    ax.scatter(xs, ys, s=400, color="#aec7e8", zorder=2)
 
-    # Draw nodes
-    for node, (x, y) in pos.items():
-        ax.scatter(
-            x, y,
-            s=420,
-            color="#f2a900",    # warm highlight colour
-            edgecolors="black",
-            zorder=2
-        )
-        ax.text(
-            x,
-            y,
-            node,
-            fontsize=9,
-            ha="center",
-            va="center",
-            zorder=3
-        )
+    for i, (item, _) in enumerate(sorted_neighbours):
+        ax.text(xs[i] * 1.1, ys[i] * 1.1, item, ha="center", va="center", fontsize=9)
 
-    ax.set_aspect("equal")
     ax.axis("off")
-    plt.tight_layout()
     return fig
 
+
 def draw_top_k_association_graph(graph, top_k=8):
     """
     Compact, clean item relationship graph
     showing top-K strongest associations.
     Optimised for Streamlit display.
     """
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.collections import LineCollection
 
     edges = strongest_associations(graph, top_n=top_k)
     if not edges:
         return None
 
-    # Unique nodes
-    nodes = list({n for a, b, _ in edges for n in (a, b)})
+    # Unique nodes, in first-appearance order: dict.fromkeys dedups in
+    # one C pass and keeps the layout deterministic across rerenders
+    # (so the cached _ring coordinates always map to the same nodes)
+    nodes = list(dict.fromkeys(n for a, b, _ in edges for n in (a, b)))
 
     # Smaller figure to fit Streamlit
     fig, ax = plt.subplots(figsize=(4.6, 3.8))
@@ -135,43 +99,41 @@ def draw_top_k_association_graph(graph, top_k=8):
         pad=6
     )
 
-    # Tighter circular layout
-    angles = np.linspace(0, 2 * np.pi, len(nodes), endpoint=False)
-    radius = 1.9
-    pos = {
-        node: (radius * np.cos(a), radius * np.sin(a))
-        for node, a in zip(nodes, angles)
-    }
-
-    # Draw thin arrow edges
-    for a, b, _ in edges:
-        x1, y1 = pos[a]
-        x2, y2 = pos[b]
-
-        arrow = FancyArrowPatch(
-            (x1, y1),
-            (x2, y2),
-            arrowstyle='->',
-            linewidth=0.6,
-            color='gray',
+    # Tighter circular layout, shared across rerenders via _ring
+    xs, ys = _ring(len(nodes), 1.9)
+    node_index = {node: i for i, node in enumerate(nodes)}
+
+    # Draw all edges as one LineCollection — a single C-level draw
+    # call instead of one Artist per edge
+    segments = [
+        (
+            (xs[node_index[a]], ys[node_index[a]]),
+            (xs[node_index[b]], ys[node_index[b]]),
+        )
+        for a, b, _ in edges
+    ]
+    ax.add_collection(
+        LineCollection(
+            segments,
+            linewidths=0.6,
+            colors='gray',
             alpha=0.6,
-            mutation_scale=8,
             zorder=1
         )
-        ax.add_patch(arrow)
-
-    # Draw nodes (smaller + readable)
-    for node, (x, y) in pos.items():
-        ax.scatter(
-            x, y,
-            s=360,
-            color='#f2a900',
-            edgecolors='black',
-            linewidth=0.9,
-            zorder=2
-        )
+    )
+
+    # Draw all nodes with one scatter call (smaller + readable)
+    ax.scatter(
+        xs, ys,
+        s=360,
+        color='#f2a900',
+        edgecolors='black',
+        linewidth=0.9,
+        zorder=2
+    )
+    for node, i in node_index.items():
         ax.text(
-            x, y,
+            xs[i], ys[i],
             node,
             ha='center',
             va='center',
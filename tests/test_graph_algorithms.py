@@ -16,10 +16,11 @@ from graph_algorithms import (
 # ============================================================
 # FIXTURE: SMALL DETERMINISTIC GRAPH
 # ============================================================
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_graph():
     """
     A small, deterministic co-purchase graph for testing.
+    Module-scoped: no test mutates the dict, so it is built once.
 
     Graph structure:
         bread -- milk (3)
@@ -5,17 +5,22 @@ a co-purchase graph based on (Member_number, Date) transaction grouping.
 """
 
 import csv
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
 from itertools import combinations
-from typing import Dict, List, Tuple
+from typing import Dict, Set, Tuple
 
 from copurchase_graph import CoPurchaseGraph
 
 
-def load_transactions(filename: str) -> Dict[Tuple[str, str], List[str]]:
+def load_transactions(filename: str) -> Dict[Tuple[str, str], Set[str]]:
     """
     Read the supermarket dataset and group items by (Member_number, Date).
 
+    The file is streamed row by row; each basket is kept as a set so
+    duplicate items are dropped at parse time rather than stored and
+    deduplicated again later.
+
     NOTE:
     This version is hardcoded for your dataset, which contains:
         - "Member_number"
@@ -23,33 +28,42 @@ def load_transactions(filename: str) -> Dict[Tuple[str, str], List[str]]:
         - "itemDescription"
     """
 
-    transactions = defaultdict(list)
+    transactions = defaultdict(set)
 
     with open(filename, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+
+        header = next(reader, [])
 
         # Hardcoded column names for your dataset
         member_col = "Member_number"
         date_col = "Date"
         item_col = "itemDescription"
 
-        # Check presence of columns
-        if member_col not in reader.fieldnames or \
-           date_col not in reader.fieldnames or \
-           item_col not in reader.fieldnames:
+        # Resolve the column indices once from the header; rows are
+        # then indexed positionally, avoiding the per-row dict that
+        # csv.DictReader allocates
+        try:
+            member_idx = header.index(member_col)
+            date_idx = header.index(date_col)
+            item_idx = header.index(item_col)
+        except ValueError:
             raise ValueError(
                 f"CSV must contain: {member_col}, {date_col}, {item_col}. "
-                f"Found: {reader.fieldnames}"
+                f"Found: {header}"
             )
 
-        # Build baskets
+        # Build baskets. Items are interned: every basket, adjacency
+        # key and Counter entry then shares one string object per
+        # product, so later hashing/equality is a pointer check in the
+        # common case.
         for row in reader:
-            member = row[member_col].strip()
-            date = row[date_col].strip()
-            item = row[item_col].strip()
+            item = sys.intern(row[item_idx].strip())
 
             if item:
-                transactions[(member, date)].append(item)
+                member = row[member_idx].strip()
+                date = row[date_idx].strip()
+                transactions[(member, date)].add(item)
 
     return transactions
 
@@ -60,21 +74,40 @@ def build_graph_from_file(filename: str) -> CoPurchaseGraph:
 
     Steps:
         1. Load transactions grouped by (Member_number, Date)
-        2. For each basket, generate item pairs
-        3. Add/update edges in the graph
+        2. Tally item pairs across all baskets into a Counter
+        3. Bulk-load the aggregated counts into the graph
+        4. Pre-build the shared edge arrays used by the ranking queries
+
+    Aggregating with a Counter first means the graph sees one update
+    per distinct pair instead of one method call per observation, so
+    the build is bound by C-level Counter hashing rather than Python
+    method dispatch.
     """
 
     transactions = load_transactions(filename)
 
     graph = CoPurchaseGraph()
+    pair_counts = Counter()
 
     for basket in transactions.values():
-        unique_items = list(set(basket))  # remove duplicates within same transaction
-
-        for item in unique_items:
+        # Baskets arrive as sets, already de-duplicated by the loader
+        for item in basket:
             graph.add_item(item)
 
-        for itemA, itemB in combinations(unique_items, 2):
-            graph.add_co_purchase(itemA, itemB)
+        # Singleton baskets yield no pairs — skip the combinations call
+        if len(basket) < 2:
+            continue
+
+        # Sorting gives canonical (a < b) pairs, so (a, b) and (b, a)
+        # can never be counted separately
+        pair_counts.update(combinations(sorted(basket), 2))
+
+    graph.bulk_add_co_purchases(pair_counts)
+
+    # Warm the cached (items, src, dst, weights) arrays now, at build
+    # time: frequent_pairs, top_product_bundles and the association
+    # ranking all reuse this one structure, so the first query after
+    # loading does not pay for the flatten.
+    graph.as_edge_arrays()
 
     return graph